@@ -40,14 +40,27 @@ interface AdminUser {
   lastLogin?: string;
 }
 
-interface AdminStats {
-  totalUsers: number;
-  activeUsers: number;
-  totalSwaps: number;
-  completedSwaps: number;
-  pendingSwaps: number;
+interface CategoryCount {
+  category: string;
+  count: number;
 }
 
+// Response of /api/admin/analytics (served from the daily rollup tables)
+interface AdminAnalytics {
+  start: string;
+  days: number;
+  swaps_per_day: { day: string; by_status: Record<string, number> }[];
+  top_skill_categories: {
+    offered: CategoryCount[];
+    wanted: CategoryCount[];
+    requested: CategoryCount[];
+  };
+  new_users_per_day: { day: string; count: number }[];
+  rating_trend: { day: string; count: number; rating_sum: number; average: number | null }[];
+}
+
+const ANALYTICS_DAYS = 30;
+
 export default function AdminPanel() {
   const { user, isLoading, isAuthenticated } = useAuth();
   const { toast } = useToast();
@@ -84,15 +97,51 @@ export default function AdminPanel() {
     }
   }, [isAdmin, isAuthenticated, isLoading, toast]);
 
-  // Mock data for admin functionality - replace with real API calls
-  const mockStats: AdminStats = {
-    totalUsers: 1247,
-    activeUsers: 892,
-    totalSwaps: 3456,
-    completedSwaps: 2891,
-    pendingSwaps: 234,
+  const {
+    data: analytics,
+    isLoading: loadingAnalytics,
+    isError: analyticsFailed,
+    error: analyticsError,
+  } = useQuery<AdminAnalytics>({
+    queryKey: [`/api/admin/analytics?days=${ANALYTICS_DAYS}`],
+    enabled: isAuthenticated && !!isAdmin,
+  });
+
+  const swapTotals: Record<string, number> = {};
+  for (const { by_status } of analytics?.swaps_per_day ?? []) {
+    for (const [status, count] of Object.entries(by_status)) {
+      swapTotals[status] = (swapTotals[status] ?? 0) + count;
+    }
+  }
+  const stats = {
+    newUsers: (analytics?.new_users_per_day ?? []).reduce((sum, d) => sum + d.count, 0),
+    totalSwaps: Object.values(swapTotals).reduce((sum, count) => sum + count, 0),
+    completedSwaps: swapTotals.completed ?? 0,
+    pendingSwaps: swapTotals.pending ?? 0,
   };
+  const ratingCount = (analytics?.rating_trend ?? []).reduce((sum, d) => sum + d.count, 0);
+  const ratingSum = (analytics?.rating_trend ?? []).reduce((sum, d) => sum + d.rating_sum, 0);
+  const averageRating = ratingCount ? ratingSum / ratingCount : null;
+
+  // One row per day with any activity, newest first
+  const growth: Record<string, { users: number; swaps: number; rating: number | null }> = {};
+  const growthRow = (day: string) => (growth[day] ??= { users: 0, swaps: 0, rating: null });
+  for (const { day, count } of analytics?.new_users_per_day ?? []) growthRow(day).users = count;
+  for (const { day, by_status } of analytics?.swaps_per_day ?? []) {
+    growthRow(day).swaps = Object.values(by_status).reduce((sum, count) => sum + count, 0);
+  }
+  for (const { day, average } of analytics?.rating_trend ?? []) growthRow(day).rating = average;
+  const growthDays = Object.entries(growth)
+    .map(([day, row]) => ({ day, ...row }))
+    .sort((a, b) => b.day.localeCompare(a.day));
 
+  const formatStat = (value: number | string) => {
+    if (loadingAnalytics) return <Skeleton className="h-8 w-16" />;
+    if (analyticsFailed) return "–";
+    return typeof value === "number" ? value.toLocaleString() : value;
+  };
+
+  // Mock data for admin functionality - replace with real API calls
   const mockUsers: AdminUser[] = [
     {
       id: "1",
@@ -221,6 +270,17 @@ export default function AdminPanel() {
           <p className="text-gray-600">Manage platform users, content, and analytics.</p>
         </div>
 
+        {analyticsFailed && (
+          <Card className="mb-6 border-red-200 bg-red-50">
+            <CardContent className="pt-6">
+              <div className="flex items-center text-red-700">
+                <AlertTriangle className="h-5 w-5 mr-2" />
+                <p>Could not load platform analytics: {analyticsError?.message}</p>
+              </div>
+            </CardContent>
+          </Card>
+        )}
+
         {/* Stats Overview */}
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-6 mb-8">
           <Card>
@@ -228,8 +288,8 @@ export default function AdminPanel() {
               <div className="flex items-center">
                 <Users className="h-8 w-8 text-blue-600" />
                 <div className="ml-4">
-                  <p className="text-sm font-medium text-gray-600">Total Users</p>
-                  <p className="text-2xl font-bold text-gray-900">{mockStats.totalUsers.toLocaleString()}</p>
+                  <p className="text-sm font-medium text-gray-600">New Users ({ANALYTICS_DAYS}d)</p>
+                  <div className="text-2xl font-bold text-gray-900">{formatStat(stats.newUsers)}</div>
                 </div>
               </div>
             </CardContent>
@@ -238,10 +298,10 @@ export default function AdminPanel() {
           <Card>
             <CardContent className="pt-6">
               <div className="flex items-center">
-                <UserCheck className="h-8 w-8 text-green-600" />
+                <TrendingUp className="h-8 w-8 text-green-600" />
                 <div className="ml-4">
-                  <p className="text-sm font-medium text-gray-600">Active Users</p>
-                  <p className="text-2xl font-bold text-gray-900">{mockStats.activeUsers.toLocaleString()}</p>
+                  <p className="text-sm font-medium text-gray-600">Avg Rating</p>
+                  <div className="text-2xl font-bold text-gray-900">{formatStat(averageRating === null ? "–" : averageRating.toFixed(2))}</div>
                 </div>
               </div>
             </CardContent>
@@ -252,8 +312,8 @@ export default function AdminPanel() {
               <div className="flex items-center">
                 <Activity className="h-8 w-8 text-purple-600" />
                 <div className="ml-4">
-                  <p className="text-sm font-medium text-gray-600">Total Swaps</p>
-                  <p className="text-2xl font-bold text-gray-900">{mockStats.totalSwaps.toLocaleString()}</p>
+                  <p className="text-sm font-medium text-gray-600">Swaps ({ANALYTICS_DAYS}d)</p>
+                  <div className="text-2xl font-bold text-gray-900">{formatStat(stats.totalSwaps)}</div>
                 </div>
               </div>
             </CardContent>
@@ -265,7 +325,7 @@ export default function AdminPanel() {
                 <CheckCircle className="h-8 w-8 text-green-600" />
                 <div className="ml-4">
                   <p className="text-sm font-medium text-gray-600">Completed</p>
-                  <p className="text-2xl font-bold text-gray-900">{mockStats.completedSwaps.toLocaleString()}</p>
+                  <div className="text-2xl font-bold text-gray-900">{formatStat(stats.completedSwaps)}</div>
                 </div>
               </div>
             </CardContent>
@@ -277,7 +337,7 @@ export default function AdminPanel() {
                 <AlertTriangle className="h-8 w-8 text-yellow-600" />
                 <div className="ml-4">
                   <p className="text-sm font-medium text-gray-600">Pending</p>
-                  <p className="text-2xl font-bold text-gray-900">{mockStats.pendingSwaps.toLocaleString()}</p>
+                  <div className="text-2xl font-bold text-gray-900">{formatStat(stats.pendingSwaps)}</div>
                 </div>
               </div>
             </CardContent>
@@ -423,43 +483,77 @@ export default function AdminPanel() {
                   </CardTitle>
                 </CardHeader>
                 <CardContent>
-                  <div className="text-center py-8">
-                    <TrendingUp className="w-12 h-12 text-gray-300 mx-auto mb-4" />
-                    <h3 className="text-lg font-medium text-gray-900 mb-2">
-                      Analytics Dashboard
-                    </h3>
-                    <p className="text-gray-500">
-                      Detailed analytics and insights coming soon.
-                    </p>
-                  </div>
+                  {loadingAnalytics ? (
+                    <Skeleton className="h-48 w-full" />
+                  ) : analyticsFailed ? (
+                    <p className="text-center text-red-600 py-4">Analytics are unavailable.</p>
+                  ) : (
+                    <Table>
+                      <TableHeader>
+                        <TableRow>
+                          <TableHead>Day</TableHead>
+                          <TableHead>New Users</TableHead>
+                          <TableHead>Swaps</TableHead>
+                          <TableHead>Avg Rating</TableHead>
+                        </TableRow>
+                      </TableHeader>
+                      <TableBody>
+                        {growthDays.map(({ day, users, swaps, rating }) => (
+                          <TableRow key={day}>
+                            <TableCell>{new Date(day).toLocaleDateString(undefined, { timeZone: "UTC" })}</TableCell>
+                            <TableCell>{users}</TableCell>
+                            <TableCell>{swaps}</TableCell>
+                            <TableCell>{rating === null ? "–" : rating.toFixed(2)}</TableCell>
+                          </TableRow>
+                        ))}
+                      </TableBody>
+                    </Table>
+                  )}
+                  {!loadingAnalytics && !analyticsFailed && growthDays.length === 0 && (
+                    <p className="text-center text-gray-500 py-4">No activity in the last {ANALYTICS_DAYS} days.</p>
+                  )}
                 </CardContent>
               </Card>
 
               <Card>
                 <CardHeader>
-                  <CardTitle>Popular Skills</CardTitle>
+                  <CardTitle>Swaps by Status</CardTitle>
                 </CardHeader>
                 <CardContent>
                   <div className="space-y-3">
-                    <div className="flex justify-between items-center">
-                      <span className="font-medium">React Development</span>
-                      <Badge variant="secondary">234 users</Badge>
-                    </div>
-                    <div className="flex justify-between items-center">
-                      <span className="font-medium">UI/UX Design</span>
-                      <Badge variant="secondary">189 users</Badge>
-                    </div>
-                    <div className="flex justify-between items-center">
-                      <span className="font-medium">Python</span>
-                      <Badge variant="secondary">156 users</Badge>
-                    </div>
-                    <div className="flex justify-between items-center">
-                      <span className="font-medium">Digital Marketing</span>
-                      <Badge variant="secondary">143 users</Badge>
-                    </div>
+                    {Object.entries(swapTotals).map(([status, count]) => (
+                      <div key={status} className="flex justify-between items-center">
+                        <span className="font-medium capitalize">{status}</span>
+                        <Badge variant="secondary">{count.toLocaleString()} swaps</Badge>
+                      </div>
+                    ))}
+                    {!loadingAnalytics && !analyticsFailed && Object.keys(swapTotals).length === 0 && (
+                      <p className="text-gray-500">No swaps in the last {ANALYTICS_DAYS} days.</p>
+                    )}
                   </div>
                 </CardContent>
               </Card>
+
+              {(["requested", "offered"] as const).map((kind) => (
+                <Card key={kind}>
+                  <CardHeader>
+                    <CardTitle>Top {kind === "requested" ? "Requested" : "Offered"} Categories</CardTitle>
+                  </CardHeader>
+                  <CardContent>
+                    <div className="space-y-3">
+                      {(analytics?.top_skill_categories[kind] ?? []).map(({ category, count }) => (
+                        <div key={category} className="flex justify-between items-center">
+                          <span className="font-medium">{category}</span>
+                          <Badge variant="secondary">{count.toLocaleString()}</Badge>
+                        </div>
+                      ))}
+                      {!loadingAnalytics && !analyticsFailed && (analytics?.top_skill_categories[kind] ?? []).length === 0 && (
+                        <p className="text-gray-500">No data in the last {ANALYTICS_DAYS} days.</p>
+                      )}
+                    </div>
+                  </CardContent>
+                </Card>
+              ))}
             </div>
           </TabsContent>
 
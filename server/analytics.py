@@ -0,0 +1,328 @@
+"""
+Incremental analytics rollups for the admin dashboard.
+
+Each source table is aggregated into small per-day tables. A watermark per
+source remembers the newest created_at/updated_at already folded in; a refresh
+only looks at rows past the watermark, works out which days they belong to and
+recomputes just those days. Recomputing whole days (rather than adding deltas)
+keeps refreshes idempotent, so a status change on an old swap simply rebuilds
+that swap's day.
+
+Skills are removed from profiles with a hard DELETE, which no timestamp can
+reveal, so every refresh also rebuilds the offered/wanted days inside the
+dashboard window. Other hard deletes, and offered/wanted days older than the
+window, are only corrected by backfill_analytics.py.
+"""
+import asyncio
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Date, String, and_, cast, delete, func, insert, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal
+from models import (
+    User, Skill, UserSkillOffered, UserSkillWanted, SwapRequest, Rating,
+    AnalyticsWatermark, DailySwapStats, DailySkillCategoryStats, DailyUserSignups, DailyRatingStats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows committed late can carry a timestamp slightly older than the watermark,
+# so every refresh re-reads this much history. Safe because days are rebuilt.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Seconds between background refreshes
+REFRESH_INTERVAL = int(os.getenv("ANALYTICS_REFRESH_INTERVAL", 300))
+
+# Longest window the dashboard can ask for, in days
+MAX_DASHBOARD_DAYS = 365
+
+# Serializes refreshes across workers (pg_advisory_xact_lock key)
+ROLLUP_LOCK_ID = 726_001
+
+
+def _day(column):
+    return cast(column, Date)
+
+
+def _day_filter(column, days: List[date]):
+    # One half-open range per run of consecutive days, so postgres can use the
+    # created_at index and an old day doesn't widen the scan to everything since
+    runs = []
+    start = end = days[0]
+    for day in days[1:]:
+        if day == end + timedelta(days=1):
+            end = day
+        else:
+            runs.append((start, end))
+            start = end = day
+    runs.append((start, end))
+
+    return or_(*[
+        and_(
+            column >= datetime.combine(first, datetime.min.time()),
+            column < datetime.combine(last + timedelta(days=1), datetime.min.time()),
+        )
+        for first, last in runs
+    ])
+
+
+# Rebuilders: delete the given days from the rollup tables and re-aggregate them
+
+async def _rebuild_swaps(db: AsyncSession, days: List[date]):
+    await db.execute(delete(DailySwapStats).where(DailySwapStats.day.in_(days)))
+    await db.execute(
+        delete(DailySkillCategoryStats).where(
+            DailySkillCategoryStats.day.in_(days),
+            DailySkillCategoryStats.kind == "requested",
+        )
+    )
+
+    day = _day(SwapRequest.created_at)
+    await db.execute(
+        insert(DailySwapStats).from_select(
+            ["day", "status", "count"],
+            select(day, cast(SwapRequest.status, String), func.count())
+            .where(_day_filter(SwapRequest.created_at, days))
+            .group_by(day, SwapRequest.status),
+        )
+    )
+    await db.execute(
+        insert(DailySkillCategoryStats).from_select(
+            ["day", "kind", "category", "count"],
+            select(day, literal("requested"), Skill.category, func.count())
+            .join(Skill, SwapRequest.target_skill_id == Skill.id)
+            .where(_day_filter(SwapRequest.created_at, days))
+            .group_by(day, Skill.category),
+        )
+    )
+
+
+def _skill_rebuilder(model, kind: str):
+    async def rebuild(db: AsyncSession, days: List[date]):
+        await db.execute(
+            delete(DailySkillCategoryStats).where(
+                DailySkillCategoryStats.day.in_(days),
+                DailySkillCategoryStats.kind == kind,
+            )
+        )
+        day = _day(model.created_at)
+        await db.execute(
+            insert(DailySkillCategoryStats).from_select(
+                ["day", "kind", "category", "count"],
+                select(day, literal(kind), Skill.category, func.count())
+                .join(Skill, model.skill_id == Skill.id)
+                .where(_day_filter(model.created_at, days))
+                .group_by(day, Skill.category),
+            )
+        )
+    return rebuild
+
+
+async def _rebuild_signups(db: AsyncSession, days: List[date]):
+    await db.execute(delete(DailyUserSignups).where(DailyUserSignups.day.in_(days)))
+    day = _day(User.created_at)
+    await db.execute(
+        insert(DailyUserSignups).from_select(
+            ["day", "count"],
+            select(day, func.count())
+            .where(_day_filter(User.created_at, days))
+            .group_by(day),
+        )
+    )
+
+
+async def _rebuild_ratings(db: AsyncSession, days: List[date]):
+    await db.execute(delete(DailyRatingStats).where(DailyRatingStats.day.in_(days)))
+    day = _day(Rating.created_at)
+    await db.execute(
+        insert(DailyRatingStats).from_select(
+            ["day", "count", "rating_sum"],
+            select(day, func.count(), func.sum(Rating.rating))
+            .where(_day_filter(Rating.created_at, days))
+            .group_by(day),
+        )
+    )
+
+
+# source name -> (bucket column, change-tracking column, rebuilder, rebuild dashboard window)
+SOURCES = {
+    "swap_requests": (SwapRequest.created_at, SwapRequest.updated_at, _rebuild_swaps, False),
+    "user_skills_offered": (UserSkillOffered.created_at, UserSkillOffered.created_at, _skill_rebuilder(UserSkillOffered, "offered"), True),
+    "user_skills_wanted": (UserSkillWanted.created_at, UserSkillWanted.created_at, _skill_rebuilder(UserSkillWanted, "wanted"), True),
+    "users": (User.created_at, User.created_at, _rebuild_signups, False),
+    "ratings": (Rating.created_at, Rating.created_at, _rebuild_ratings, False),
+}
+
+
+async def _get_watermark(db: AsyncSession, source: str) -> Optional[datetime]:
+    result = await db.execute(
+        select(AnalyticsWatermark.last_seen_at).where(AnalyticsWatermark.source == source)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _set_watermark(db: AsyncSession, source: str, last_seen_at: datetime):
+    stmt = pg_insert(AnalyticsWatermark).values(
+        source=source, last_seen_at=last_seen_at, updated_at=datetime.utcnow()
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AnalyticsWatermark.source],
+            set_={"last_seen_at": stmt.excluded.last_seen_at, "updated_at": stmt.excluded.updated_at},
+        )
+    )
+
+
+async def refresh_source(db: AsyncSession, source: str, since: Optional[datetime] = None) -> int:
+    """Fold changed rows into the rollups.
+
+    By default that is rows changed after the stored watermark (minus the
+    overlap); an explicit `since` includes rows changed at or after it.
+    Sources flagged to rebuild the dashboard window also rebuild every day in
+    it. Returns the number of days rebuilt. Does not commit.
+    """
+    bucket_col, changed_col, rebuild, rebuild_window = SOURCES[source]
+
+    watermark = await _get_watermark(db, source)
+
+    query = select(_day(bucket_col), func.max(changed_col)).where(
+        bucket_col.is_not(None), changed_col.is_not(None)
+    )
+    if since is not None:
+        query = query.where(changed_col >= since)
+    elif watermark is not None:
+        query = query.where(changed_col > watermark - WATERMARK_OVERLAP)
+    rows = (await db.execute(query.group_by(_day(bucket_col)))).all()
+
+    days = {row[0] for row in rows}
+    if rebuild_window:
+        today = datetime.utcnow().date()
+        days.update(today - timedelta(days=offset) for offset in range(MAX_DASHBOARD_DAYS))
+    if not days:
+        return 0
+    await rebuild(db, sorted(days))
+
+    if rows:
+        newest = max(row[1] for row in rows)
+        if watermark is None or newest > watermark:
+            await _set_watermark(db, source, newest)
+    return len(days)
+
+
+async def refresh_rollups(db: AsyncSession) -> Dict[str, int]:
+    """Incrementally refresh every rollup in a single transaction."""
+    await db.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_ID)))
+    rebuilt = {}
+    for source in SOURCES:
+        rebuilt[source] = await refresh_source(db, source)
+    await db.commit()
+    return rebuilt
+
+
+async def backfill_rollups(db: AsyncSession, since: Optional[date] = None) -> Dict[str, int]:
+    """Rebuild rollups from the source tables.
+
+    With no `since` everything is rebuilt. Otherwise the rollup rows for days
+    from `since` onwards are cleared and rebuilt, along with any older days
+    whose rows were updated since then. Clearing first means days whose rows
+    were all hard-deleted disappear as well.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_ID)))
+    rollups = (DailySwapStats, DailySkillCategoryStats, DailyUserSignups, DailyRatingStats)
+    if since is None:
+        for model in rollups:
+            await db.execute(delete(model))
+        await db.execute(delete(AnalyticsWatermark))
+        since_dt = None
+    else:
+        for model in rollups:
+            await db.execute(delete(model).where(model.day >= since))
+        since_dt = datetime.combine(since, datetime.min.time())
+
+    rebuilt = {}
+    for source in SOURCES:
+        rebuilt[source] = await refresh_source(db, source, since=since_dt)
+    await db.commit()
+    return rebuilt
+
+
+async def run_refresh_loop(interval: int = REFRESH_INTERVAL):
+    """Background task started from the app lifespan."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await refresh_rollups(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Analytics rollup refresh failed")
+        await asyncio.sleep(interval)
+
+
+# Dashboard reads: these only touch the rollup tables
+
+async def get_dashboard_stats(db: AsyncSession, days: int = 30) -> Dict[str, Any]:
+    # Buckets are cast from utcnow() timestamps, so the window is in UTC too
+    start = datetime.utcnow().date() - timedelta(days=days - 1)
+
+    swaps = await db.execute(
+        select(DailySwapStats.day, DailySwapStats.status, DailySwapStats.count)
+        .where(DailySwapStats.day >= start)
+        .order_by(DailySwapStats.day)
+    )
+    swaps_per_day: Dict[str, Dict[str, int]] = {}
+    for day, swap_status, count in swaps:
+        swaps_per_day.setdefault(day.isoformat(), {})[swap_status] = count
+
+    categories = await db.execute(
+        select(
+            DailySkillCategoryStats.kind,
+            DailySkillCategoryStats.category,
+            func.sum(DailySkillCategoryStats.count).label("total"),
+        )
+        .where(DailySkillCategoryStats.day >= start)
+        .group_by(DailySkillCategoryStats.kind, DailySkillCategoryStats.category)
+        .order_by(func.sum(DailySkillCategoryStats.count).desc())
+    )
+    top_categories: Dict[str, List[Dict[str, Any]]] = {"offered": [], "wanted": [], "requested": []}
+    for kind, category, total in categories:
+        if len(top_categories[kind]) < 10:
+            top_categories[kind].append({"category": category, "count": int(total)})
+
+    signups = await db.execute(
+        select(DailyUserSignups.day, DailyUserSignups.count)
+        .where(DailyUserSignups.day >= start)
+        .order_by(DailyUserSignups.day)
+    )
+
+    ratings = await db.execute(
+        select(DailyRatingStats.day, DailyRatingStats.count, DailyRatingStats.rating_sum)
+        .where(DailyRatingStats.day >= start)
+        .order_by(DailyRatingStats.day)
+    )
+
+    return {
+        "start": start.isoformat(),
+        "days": days,
+        "swaps_per_day": [
+            {"day": day, "by_status": by_status} for day, by_status in swaps_per_day.items()
+        ],
+        "top_skill_categories": top_categories,
+        "new_users_per_day": [
+            {"day": day.isoformat(), "count": count} for day, count in signups
+        ],
+        "rating_trend": [
+            {
+                "day": day.isoformat(),
+                "count": count,
+                "rating_sum": rating_sum,
+                "average": round(rating_sum / count, 2) if count else None,
+            }
+            for day, count, rating_sum in ratings
+        ],
+    }
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Rebuild the admin dashboard analytics rollups
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+from dotenv import load_dotenv
+
+# Load environment variables before database.py reads DATABASE_URL
+load_dotenv()
+
+from database import AsyncSessionLocal, init_db
+from analytics import backfill_rollups
+
+async def run(since):
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        rebuilt = await backfill_rollups(db, since=since)
+    for source, days in rebuilt.items():
+        print(f"{source}: {days} day(s) rebuilt")
+
+def main():
+    """Backfill rollups from the source tables"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="rebuild days from this date (YYYY-MM-DD) plus older days updated since; default rebuilds everything",
+    )
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(run(args.since))
+    except Exception as e:
+        print(f"Error backfilling analytics: {e}")
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,7 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db, init_db
 from models import User, Skill, UserSkillOffered, UserSkillWanted, SwapRequest, Rating
 from schemas import UserCreate, UserLogin, UserResponse, SkillCreate, SkillResponse
-from auth import create_access_token, verify_password, get_password_hash, get_current_user, SECRET_KEY
+from auth import create_access_token, verify_password, get_password_hash, get_current_user, get_current_admin_user, SECRET_KEY
+from analytics import MAX_DASHBOARD_DAYS, get_dashboard_stats, run_refresh_loop
 import asyncio
 
 # WebSocket connection manager
@@ -56,9 +57,14 @@ manager = ConnectionManager()
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    rollup_task = asyncio.create_task(run_refresh_loop())
     yield
     # Shutdown
-    pass
+    rollup_task.cancel()
+    try:
+        await rollup_task
+    except asyncio.CancelledError:
+        pass
 
 # FastAPI app
 app = FastAPI(
@@ -289,6 +295,21 @@ async def get_received_swaps(
     
     return swaps
 
+# Admin analytics (reads only the rollup tables kept by analytics.py)
+@app.get("/api/admin/analytics")
+async def get_admin_analytics(
+    days: int = 30,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if days < 1 or days > MAX_DASHBOARD_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"days must be between 1 and {MAX_DASHBOARD_DAYS}"
+        )
+    
+    return await get_dashboard_stats(db, days)
+
 # Serve static files (for production)
 if os.path.exists("dist/public"):
     app.mount("/", StaticFiles(directory="dist/public", html=True), name="static")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Date, Integer, BigInteger, ForeignKey, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from database import Base
@@ -39,7 +39,7 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     email_verified = Column(Boolean, default=False)
     last_login = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
@@ -73,7 +73,7 @@ class UserSkillOffered(Base):
     proficiency_level = Column(Enum(ProficiencyLevel), nullable=False)
     description = Column(Text)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     # Relationships
     user = relationship("User", back_populates="skills_offered")
@@ -88,7 +88,7 @@ class UserSkillWanted(Base):
     urgency_level = Column(Enum(UrgencyLevel), nullable=False)
     description = Column(Text)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     # Relationships
     user = relationship("User", back_populates="skills_wanted")
@@ -106,8 +106,8 @@ class SwapRequest(Base):
     status = Column(Enum(SwapStatus), default=SwapStatus.pending)
     scheduled_at = Column(DateTime)
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
     requester = relationship("User", foreign_keys=[requester_id], back_populates="swap_requests_sent")
@@ -124,9 +124,45 @@ class Rating(Base):
     swap_request_id = Column(UUID(as_uuid=True), ForeignKey("swap_requests.id"))
     rating = Column(Integer, nullable=False)  # 1-5 stars
     review = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     # Relationships
     rater = relationship("User", foreign_keys=[rater_id], back_populates="ratings_given")
     ratee = relationship("User", foreign_keys=[ratee_id], back_populates="ratings_received")
-    swap_request = relationship("SwapRequest")
\ No newline at end of file
+    swap_request = relationship("SwapRequest")
+
+# Analytics rollups (maintained by analytics.py, read by the admin dashboard)
+class AnalyticsWatermark(Base):
+    __tablename__ = "analytics_watermarks"
+    
+    source = Column(String(50), primary_key=True)
+    last_seen_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class DailySwapStats(Base):
+    __tablename__ = "analytics_daily_swaps"
+    
+    day = Column(Date, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class DailySkillCategoryStats(Base):
+    __tablename__ = "analytics_daily_skill_categories"
+    
+    day = Column(Date, primary_key=True)
+    kind = Column(String(20), primary_key=True)  # offered, wanted, requested
+    category = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class DailyUserSignups(Base):
+    __tablename__ = "analytics_daily_signups"
+    
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class DailyRatingStats(Base):
+    __tablename__ = "analytics_daily_ratings"
+    
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
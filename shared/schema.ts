@@ -8,6 +8,9 @@ import {
   uuid,
   boolean,
   integer,
+  bigint,
+  date,
+  primaryKey,
   pgEnum,
 } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
@@ -41,7 +44,9 @@ export const users = pgTable("users", {
   lastLogin: timestamp("last_login"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  index("ix_users_created_at").on(table.createdAt),
+]);
 
 // Skills catalog
 export const skills = pgTable("skills", {
@@ -73,7 +78,9 @@ export const userSkillsOffered = pgTable("user_skills_offered", {
   description: text("description"),
   isActive: boolean("is_active").default(true),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("ix_user_skills_offered_created_at").on(table.createdAt),
+]);
 
 // User skills wanted
 export const userSkillsWanted = pgTable("user_skills_wanted", {
@@ -84,7 +91,9 @@ export const userSkillsWanted = pgTable("user_skills_wanted", {
   description: text("description"),
   isActive: boolean("is_active").default(true),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("ix_user_skills_wanted_created_at").on(table.createdAt),
+]);
 
 // Swap status enum
 export const swapStatus = pgEnum("swap_status", [
@@ -108,7 +117,10 @@ export const swapRequests = pgTable("swap_requests", {
   notes: text("notes"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  index("ix_swap_requests_created_at").on(table.createdAt),
+  index("ix_swap_requests_updated_at").on(table.updatedAt),
+]);
 
 // Ratings and feedback
 export const ratings = pgTable("ratings", {
@@ -119,6 +131,49 @@ export const ratings = pgTable("ratings", {
   rating: integer("rating").notNull(),
   feedback: text("feedback"),
   createdAt: timestamp("created_at").defaultNow(),
+}, (table) => [
+  index("ix_ratings_created_at").on(table.createdAt),
+]);
+
+// Analytics rollups (maintained by server/analytics.py, read by the admin dashboard)
+export const analyticsWatermarks = pgTable("analytics_watermarks", {
+  source: varchar("source", { length: 50 }).primaryKey(),
+  lastSeenAt: timestamp("last_seen_at").notNull(),
+  updatedAt: timestamp("updated_at"),
+});
+
+export const analyticsDailySwaps = pgTable(
+  "analytics_daily_swaps",
+  {
+    day: date("day").notNull(),
+    status: varchar("status", { length: 20 }).notNull(),
+    count: integer("count").notNull(),
+  },
+  (table) => [primaryKey({ name: "analytics_daily_swaps_pkey", columns: [table.day, table.status] })],
+);
+
+export const analyticsDailySkillCategories = pgTable(
+  "analytics_daily_skill_categories",
+  {
+    day: date("day").notNull(),
+    kind: varchar("kind", { length: 20 }).notNull(), // offered, wanted, requested
+    category: varchar("category", { length: 100 }).notNull(),
+    count: integer("count").notNull(),
+  },
+  (table) => [
+    primaryKey({ name: "analytics_daily_skill_categories_pkey", columns: [table.day, table.kind, table.category] }),
+  ],
+);
+
+export const analyticsDailySignups = pgTable("analytics_daily_signups", {
+  day: date("day").primaryKey(),
+  count: integer("count").notNull(),
+});
+
+export const analyticsDailyRatings = pgTable("analytics_daily_ratings", {
+  day: date("day").primaryKey(),
+  count: integer("count").notNull(),
+  ratingSum: bigint("rating_sum", { mode: "number" }).notNull(),
 });
 
 // Define relations